@@ -542,7 +542,11 @@ class PostDetailSerializer(serializers.HyperlinkedModelSerializer):
             - has_liked: Whether current user has liked (only for authenticated users)
         """
         request = self.context.get("request")
-        stats = {"likes_count": getattr(obj, "likes_count", obj.likes.count())}
+        # Prefer the view's annotation; only fall back to a COUNT query without it
+        likes_count = getattr(obj, "likes_count", None)
+        if likes_count is None:
+            likes_count = obj.likes.count()
+        stats = {"likes_count": likes_count}
 
         # Only include has_liked for authenticated users
         if request and request.user.is_authenticated:
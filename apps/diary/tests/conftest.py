@@ -7,12 +7,18 @@ This module provides:
 - JWT authentication fixtures for authenticated API requests
 """
 
+from datetime import UTC, datetime
+from functools import cache
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
 import factory
 import pytest
 from factory.django import DjangoModelFactory
 from pytest_factoryboy import register
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken
 
 from apps.diary.models import CustomUser, Like, Post
 
@@ -21,6 +27,12 @@ from apps.diary.models import CustomUser, Like, Post
 # =============================================================================
 
 
+@cache
+def hashed_password(raw_password):
+    """Hash a raw password once and reuse the hash for every user that needs it."""
+    return make_password(raw_password)
+
+
 class UserFactory(DjangoModelFactory):
     """Factory for creating regular users with unique usernames and emails."""
 
@@ -33,12 +45,9 @@ class UserFactory(DjangoModelFactory):
 
     @classmethod
     def _create(cls, model_class, *args, **kwargs):
-        """Override create to properly use create_user method."""
-        password = kwargs.pop("password", "testpass123")
-        instance = super()._create(model_class, *args, **kwargs)
-        instance.set_password(password)
-        instance.save()
-        return instance
+        """Store a pre-hashed password so the user is saved with a single INSERT."""
+        kwargs["password"] = hashed_password(kwargs.get("password", "testpass123"))
+        return super()._create(model_class, *args, **kwargs)
 
 
 class AdminUserFactory(UserFactory):
@@ -110,6 +119,19 @@ def api_client():
 
 
 @pytest.fixture
+def frozen_now(monkeypatch):
+    """
+    Pin ``timezone.now()`` to a fixed instant and return it.
+
+    Code that calls ``timezone.now()`` (e.g. the username change cooldown) then
+    sees the same instant as the test, so time-relative checks are exact.
+    """
+    now = datetime(2024, 1, 15, tzinfo=UTC)
+    monkeypatch.setattr(timezone, "now", lambda: now)
+    return now
+
+
+@pytest.fixture(scope="session")
 def user_password():
     """Return the default password used in UserFactory."""
     return "testpass123"
@@ -165,33 +187,41 @@ def like(user, post):
 
 
 def get_jwt_token(user):
-    """Generate JWT access token for a user."""
-    refresh = RefreshToken.for_user(user)
-    return str(refresh.access_token)
+    """
+    Generate JWT access token for a user.
+
+    The access token is minted directly: going through ``RefreshToken`` would
+    also write an OutstandingToken row. Tests that need outstanding tokens
+    create refresh tokens themselves.
+    """
+    return str(AccessToken.for_user(user))
 
 
 @pytest.fixture
-def authenticated_api_client(api_client, user):
+def authenticated_api_client(user):
     """Return an APIClient authenticated with the user fixture."""
+    client = APIClient()
     token = get_jwt_token(user)
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
-    return api_client
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
 
 
 @pytest.fixture
-def admin_api_client(api_client, admin_user):
+def admin_api_client(admin_user):
     """Return an APIClient authenticated with the admin_user fixture."""
+    client = APIClient()
     token = get_jwt_token(admin_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
-    return api_client
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
 
 
 @pytest.fixture
-def other_user_api_client(api_client, other_user):
+def other_user_api_client(other_user):
     """Return an APIClient authenticated with the other_user fixture."""
+    client = APIClient()
     token = get_jwt_token(other_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
-    return api_client
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
 
 
 @pytest.fixture
@@ -79,7 +79,7 @@ class TestSignUpView:
             },
         )
 
-        user = CustomUser.objects.get(username="newuser")
+        user = CustomUser.objects.only("pk").get(username="newuser")
         assert response.status_code == 302
         assert response.url == reverse("author-detail", args=[user.pk])
 
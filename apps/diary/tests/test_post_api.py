@@ -10,21 +10,50 @@ Tests cover:
 - Profanity validation
 """
 
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+
 import pytest
 from rest_framework import status
 from rest_framework.reverse import reverse
 
-from apps.diary.models import Post
+from apps.diary import validators
+from apps.diary.models import Like, Post
+from apps.diary.serializers import PostCreateSerializer, PostDetailSerializer
+
+# Resolved once at import; detail URLs are filled in from a template.
+LIST_URL = reverse("post-list-create-api")
+DETAIL_URL = reverse("post-detail-api", args=[0]).replace("/0/", "/{}/")
+
+# Valid payload for creating a post; tests extend it with {**BASE_POST, ...}.
+BASE_POST = {"title": "New Post", "content": "New content here"}
+
+# Queries issued by the post list endpoint, independent of the number of posts:
+# anonymous: pagination COUNT + page SELECT (author joined, likes annotated);
+# authenticated: additionally the JWT user lookup and the throttled
+# last_activity_at UPDATE from UserLastActivityMiddleware.
+LIST_QUERIES_ANONYMOUS = 2
+LIST_QUERIES_AUTHENTICATED_MAX = 4
+# The detail endpoint fetches the post with author and like count in one query.
+DETAIL_QUERIES_ANONYMOUS = 1
 
-pytestmark = pytest.mark.django_db
 
+def results_by_id(response):
+    """Index the results of a paginated post list response by post ID."""
+    return {p["id"]: p for p in response.data["results"]}
 
+
+@pytest.mark.django_db
 class TestPostList:
     """Tests for post list endpoint (GET /api/v1/posts/)."""
 
-    def test_list_published_only(self, api_client, post, unpublished_post):
+    def test_list_published_only(
+        self, api_client, post, unpublished_post, django_assert_num_queries
+    ):
         """Anonymous sees only published posts."""
-        response = api_client.get(reverse("post-list-create-api"))
+        with django_assert_num_queries(LIST_QUERIES_ANONYMOUS):
+            response = api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
         post_ids = [p["id"] for p in response.data["results"]]
@@ -35,40 +64,48 @@ class TestPostList:
         self, authenticated_api_client, post, unpublished_post
     ):
         """Authenticated user also sees only published posts in list."""
-        response = authenticated_api_client.get(reverse("post-list-create-api"))
+        response = authenticated_api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
         post_ids = [p["id"] for p in response.data["results"]]
         assert post.id in post_ids
         assert unpublished_post.id not in post_ids
 
-    def test_list_includes_like_count(self, api_client, post, like_factory, user):
+    def test_list_includes_like_count(
+        self, api_client, post, user, user_factory, django_assert_num_queries
+    ):
         """Post list includes like_count in stats."""
-        # Create some likes
-        like_factory(post=post, user=user)
+        # Create several likes in a single INSERT
+        Like.objects.bulk_create(
+            Like(post=post, user=liker)
+            for liker in (user, *user_factory.create_batch(2))
+        )
 
-        response = api_client.get(reverse("post-list-create-api"))
+        with django_assert_num_queries(LIST_QUERIES_ANONYMOUS):
+            response = api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
-        post_data = next(p for p in response.data["results"] if p["id"] == post.id)
-        assert "stats" in post_data
-        assert post_data["stats"]["like_count"] == 1
+        post_data = results_by_id(response)[post.id]
+        stats = post_data["stats"]
+        assert stats["like_count"] == 3
         # Anonymous users should not see has_liked field at all
-        assert "has_liked" not in post_data["stats"]
+        assert "has_liked" not in stats
 
-    def test_list_is_paginated(self, api_client, post_factory, user):
+    def test_list_is_paginated(self, api_client, user, django_assert_num_queries):
         """Post list is paginated."""
-        # Create more posts than one page
-        for _ in range(15):
-            post_factory(author=user)
+        # Create more posts than one page in a single INSERT
+        Post.objects.bulk_create(
+            Post(author=user, title=f"Post {i}", content="Content") for i in range(15)
+        )
 
-        response = api_client.get(reverse("post-list-create-api"))
+        with django_assert_num_queries(LIST_QUERIES_ANONYMOUS):
+            response = api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
-        assert "count" in response.data
-        assert "next" in response.data
-        assert "previous" in response.data
-        assert "results" in response.data
+        assert response.data["count"] == 15
+        assert response.data["next"] is not None
+        assert response.data["previous"] is None
+        assert len(response.data["results"]) == 10
 
     def test_list_has_liked_authenticated(
         self,
@@ -78,78 +115,104 @@ class TestPostList:
         user,
         other_user,
         post_factory,
+        django_assert_max_num_queries,
     ):
-        """Authenticated user sees has_liked correctly."""
+        """Authenticated user sees has_liked correctly without per-post queries."""
         # User has liked this post
         like_factory(post=post, user=user)
-        # Create another post that user hasn't liked
-        other_post = post_factory(author=other_user)
+        # Create other posts that user hasn't liked, each liked by other_user
+        other_posts = post_factory.create_batch(4, author=other_user)
+        Like.objects.bulk_create(
+            Like(post=other_post, user=other_user) for other_post in other_posts
+        )
 
-        response = authenticated_api_client.get(reverse("post-list-create-api"))
+        with django_assert_max_num_queries(LIST_QUERIES_AUTHENTICATED_MAX):
+            response = authenticated_api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
-        liked_post = next(p for p in response.data["results"] if p["id"] == post.id)
-        unliked_post = next(
-            p for p in response.data["results"] if p["id"] == other_post.id
+        posts_by_id = results_by_id(response)
+        assert posts_by_id[post.id]["stats"]["has_liked"] is True
+        for other_post in other_posts:
+            assert posts_by_id[other_post.id]["stats"]["has_liked"] is False
+
+    def test_list_no_n_plus_one(
+        self, api_client, user, user_factory, django_assert_num_queries
+    ):
+        """A full page of liked posts costs the same queries as a single post."""
+        posts = Post.objects.bulk_create(
+            Post(author=user, title=f"Post {i}", content="Content") for i in range(20)
+        )
+        likers = user_factory.create_batch(5)
+        Like.objects.bulk_create(
+            Like(post=post, user=liker) for post in posts for liker in likers
         )
-        assert liked_post["stats"]["has_liked"] is True
-        assert unliked_post["stats"]["has_liked"] is False
+
+        with django_assert_num_queries(LIST_QUERIES_ANONYMOUS):
+            response = api_client.get(LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert len(results) == 10
+        assert all(p["stats"]["like_count"] == 5 for p in results)
+        assert all(p["author"]["username"] == user.username for p in results)
 
     def test_list_content_excerpt(self, api_client, post_factory, user):
         """Content is truncated to 200 chars with ellipsis."""
         long_content = "A" * 300
         post = post_factory(author=user, content=long_content)
 
-        response = api_client.get(reverse("post-list-create-api"))
+        response = api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
-        post_data = next(p for p in response.data["results"] if p["id"] == post.id)
+        post_data = results_by_id(response)[post.id]
         assert "content_excerpt" in post_data
         assert len(post_data["content_excerpt"]) == 203  # 200 + "..."
         assert post_data["content_excerpt"].endswith("...")
 
-    def test_list_author_username(self, api_client, post):
+    def test_list_author_username(self, api_client, post, django_assert_num_queries):
         """Author includes username and URL."""
-        response = api_client.get(reverse("post-list-create-api"))
+        with django_assert_num_queries(LIST_QUERIES_ANONYMOUS):
+            response = api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
-        post_data = next(p for p in response.data["results"] if p["id"] == post.id)
+        post_data = results_by_id(response)[post.id]
         assert "author" in post_data
         assert "username" in post_data["author"]
         assert "url" in post_data["author"]
         assert "id" in post_data["author"]
 
-    def test_list_search_by_title(self, api_client, post_factory, user):
-        """Can search posts by title."""
-        post1 = post_factory(author=user, title="Unique Searchable Title")
-        post_factory(author=user, title="Other Post")
-
-        response = api_client.get(
-            reverse("post-list-create-api"), {"search": "Unique Searchable"}
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        post_ids = [p["id"] for p in response.data["results"]]
-        assert post1.id in post_ids
-        assert len(post_ids) == 1
-
-    def test_list_search_by_content(self, api_client, post_factory, user):
-        """Can search posts by content."""
-        post1 = post_factory(author=user, content="special keyword here")
-        post_factory(author=user, content="normal content")
+    @pytest.mark.parametrize(
+        ("field", "value", "search"),
+        [
+            ("title", "Unique Searchable Title", "Unique Searchable"),
+            ("content", "special keyword here", "special keyword"),
+        ],
+    )
+    def test_list_search(
+        self,
+        api_client,
+        post_factory,
+        user,
+        field,
+        value,
+        search,
+        django_assert_num_queries,
+    ):
+        """Can search posts by title and by content."""
+        post1 = post_factory(author=user, **{field: value})
+        post_factory(author=user, **{field: "Other Post"})
 
-        response = api_client.get(
-            reverse("post-list-create-api"), {"search": "special keyword"}
-        )
+        with django_assert_num_queries(LIST_QUERIES_ANONYMOUS):
+            response = api_client.get(LIST_URL, {"search": search})
 
         assert response.status_code == status.HTTP_200_OK
         post_ids = [p["id"] for p in response.data["results"]]
-        assert post1.id in post_ids
+        assert post_ids == [post1.id]
 
     def test_list_filter_by_author_username(self, api_client, post, other_user_post):
         """Can filter posts by author username."""
         response = api_client.get(
-            reverse("post-list-create-api"),
+            LIST_URL,
             {"author__username": post.author.username},
         )
 
@@ -158,93 +221,70 @@ class TestPostList:
         assert post.id in post_ids
         assert other_user_post.id not in post_ids
 
-    def test_list_has_likes_hyperlink(self, api_client, post):
+    def test_list_has_likes_hyperlink(
+        self, api_client, post, django_assert_num_queries
+    ):
         """Post list includes likes hyperlink for each post."""
-        response = api_client.get(reverse("post-list-create-api"))
+        with django_assert_num_queries(LIST_QUERIES_ANONYMOUS):
+            response = api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
-        post_data = next(p for p in response.data["results"] if p["id"] == post.id)
+        post_data = results_by_id(response)[post.id]
         assert "likes" in post_data
         assert f"?post={post.id}" in post_data["likes"]
 
 
+@pytest.mark.django_db
 class TestPostCreate:
     """Tests for post creation endpoint (POST /api/v1/posts/)."""
 
-    def test_create_requires_auth(self, api_client):
-        """Anonymous gets 401."""
-        response = api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "Test", "content": "Test content"},
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_create_success(self, authenticated_api_client, user):
-        """Authenticated user can create post."""
-        response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "New Post", "content": "New content here"},
-        )
-
-        assert response.status_code == status.HTTP_201_CREATED
-        assert Post.objects.filter(title="New Post").exists()
+        """
+        Authenticated user can create post.
 
-    def test_create_sets_author(self, authenticated_api_client, user):
-        """Author is set to current user."""
-        response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "New Post", "content": "New content here"},
-        )
+        The post is owned by the current user, published by default, and the
+        response has a likes hyperlink but no stats.
+        """
+        response = authenticated_api_client.post(LIST_URL, BASE_POST)
 
         assert response.status_code == status.HTTP_201_CREATED
-        post = Post.objects.get(title="New Post")
-        assert post.author == user
+        assert response.data["title"] == BASE_POST["title"]
+        assert response.data["content"] == BASE_POST["content"]
+        post = Post.objects.only("author_id", "published").get(pk=response.data["id"])
+        assert post.author_id == user.id
+        assert post.published is True
+        assert "stats" not in response.data
+        assert f"?post={post.id}" in response.data["likes"]
 
     def test_create_cannot_override_author(
         self, authenticated_api_client, user, other_user
     ):
         """Attempting to set author is ignored."""
         response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {
-                "title": "New Post",
-                "content": "New content here",
-                "author": other_user.id,
-            },
+            LIST_URL, {**BASE_POST, "author": other_user.id}
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        post = Post.objects.get(title="New Post")
+        post = Post.objects.only("author_id").get(pk=response.data["id"])
         # Author should be the authenticated user, not other_user
-        assert post.author == user
-
-    def test_create_published_by_default(self, authenticated_api_client):
-        """Posts are published by default."""
-        response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "New Post", "content": "New content here"},
-        )
-
-        assert response.status_code == status.HTTP_201_CREATED
-        post = Post.objects.get(title="New Post")
-        assert post.published is True
+        assert post.author_id == user.id
 
     def test_create_unpublished(self, authenticated_api_client):
         """Can create unpublished (draft) post."""
         response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "Draft Post", "content": "Draft content", "published": False},
+            LIST_URL,
+            {**BASE_POST, "published": False},
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        post = Post.objects.get(title="Draft Post")
+        # published is write-only, so it has to be read back from the database
+        post = Post.objects.only("published").get(pk=response.data["id"])
         assert post.published is False
 
     def test_create_missing_title(self, authenticated_api_client):
         """Missing title returns 400."""
         response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
+            LIST_URL,
             {"content": "Content without title"},
         )
 
@@ -254,73 +294,33 @@ class TestPostCreate:
     def test_create_missing_content(self, authenticated_api_client):
         """Missing content returns 400."""
         response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
+            LIST_URL,
             {"title": "Title without content"},
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "content" in response.data
 
-    def test_create_profanity_rejected(self, authenticated_api_client):
-        """Title with profanity returns 400."""
-        response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "fuck this", "content": "Some content"},
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "title" in response.data
-
-    def test_create_profanity_in_content_rejected(self, authenticated_api_client):
-        """Content with profanity returns 400."""
-        response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "Valid Title", "content": "This is bullshit content"},
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "content" in response.data
-
-    def test_create_response_no_stats(self, authenticated_api_client):
-        """Post create response does not include stats (no has_liked)."""
-        response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "New Post", "content": "New content here"},
-        )
-
-        assert response.status_code == status.HTTP_201_CREATED
-        # Create response should not have stats field
-        assert "stats" not in response.data
-
-    def test_create_response_has_likes_hyperlink(self, authenticated_api_client):
-        """Post create response includes likes hyperlink."""
-        response = authenticated_api_client.post(
-            reverse("post-list-create-api"),
-            {"title": "New Post", "content": "New content here"},
-        )
-
-        assert response.status_code == status.HTTP_201_CREATED
-        assert "likes" in response.data
-        post_id = response.data["id"]
-        assert f"?post={post_id}" in response.data["likes"]
-
 
+@pytest.mark.django_db
 class TestPostDetail:
     """Tests for post detail endpoint (GET /api/v1/posts/{id}/)."""
 
     def test_view_published_post(self, api_client, post):
-        """Anyone can view a published post."""
-        response = api_client.get(reverse("post-detail-api", args=[post.id]))
+        """Anyone can view a published post, with url and likes hyperlinks."""
+        response = api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == post.id
         assert response.data["title"] == post.title
+        assert "url" in response.data
+        # Should NOT have links section
+        assert "links" not in response.data
+        assert f"?post={post.id}" in response.data["likes"]
 
     def test_view_unpublished_owner_only(self, api_client, unpublished_post):
         """Non-owner gets 403 for unpublished post."""
-        response = api_client.get(
-            reverse("post-detail-api", args=[unpublished_post.id])
-        )
+        response = api_client.get(DETAIL_URL.format(unpublished_post.id))
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -328,24 +328,23 @@ class TestPostDetail:
         self, authenticated_api_client, unpublished_post
     ):
         """Owner can view their unpublished post."""
-        response = authenticated_api_client.get(
-            reverse("post-detail-api", args=[unpublished_post.id])
-        )
+        response = authenticated_api_client.get(DETAIL_URL.format(unpublished_post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == unpublished_post.id
 
     def test_view_unpublished_by_admin(self, admin_api_client, unpublished_post):
         """Admin can view any unpublished post."""
-        response = admin_api_client.get(
-            reverse("post-detail-api", args=[unpublished_post.id])
-        )
+        response = admin_api_client.get(DETAIL_URL.format(unpublished_post.id))
 
         assert response.status_code == status.HTTP_200_OK
 
-    def test_view_includes_likes_count(self, api_client, post, like):
-        """Post detail includes likes_count in stats."""
-        response = api_client.get(reverse("post-detail-api", args=[post.id]))
+    def test_view_includes_likes_count(
+        self, api_client, post, like, django_assert_num_queries
+    ):
+        """Post detail includes likes_count in stats without a separate COUNT."""
+        with django_assert_num_queries(DETAIL_QUERIES_ANONYMOUS):
+            response = api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["stats"]["likes_count"] == 1
@@ -357,48 +356,42 @@ class TestPostDetail:
         # User has liked this post
         like_factory(post=post, user=user)
 
-        response = authenticated_api_client.get(
-            reverse("post-detail-api", args=[post.id])
-        )
+        response = authenticated_api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["stats"]["has_liked"] is True
 
     def test_view_has_liked_not_liked(self, authenticated_api_client, post):
         """Authenticated user sees has_liked=False when not liked."""
-        response = authenticated_api_client.get(
-            reverse("post-detail-api", args=[post.id])
-        )
+        response = authenticated_api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["stats"]["has_liked"] is False
 
     def test_view_has_liked_not_shown_anonymous(self, api_client, post):
         """Anonymous user does not see has_liked field."""
-        response = api_client.get(reverse("post-detail-api", args=[post.id]))
+        response = api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert "has_liked" not in response.data["stats"]
 
     def test_view_published_hidden_for_others(self, other_user_api_client, post):
         """Non-owner does not see published field."""
-        response = other_user_api_client.get(reverse("post-detail-api", args=[post.id]))
+        response = other_user_api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert "published" not in response.data
 
     def test_view_published_hidden_for_anonymous(self, api_client, post):
         """Anonymous user does not see published field."""
-        response = api_client.get(reverse("post-detail-api", args=[post.id]))
+        response = api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert "published" not in response.data
 
     def test_view_published_visible_for_owner(self, authenticated_api_client, post):
         """Owner sees published field."""
-        response = authenticated_api_client.get(
-            reverse("post-detail-api", args=[post.id])
-        )
+        response = authenticated_api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert "published" in response.data
@@ -406,42 +399,26 @@ class TestPostDetail:
 
     def test_view_published_visible_for_admin(self, admin_api_client, post):
         """Admin sees published field."""
-        response = admin_api_client.get(reverse("post-detail-api", args=[post.id]))
+        response = admin_api_client.get(DETAIL_URL.format(post.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert "published" in response.data
 
-    def test_view_has_url_field(self, api_client, post):
-        """Post detail has url as the first field."""
-        response = api_client.get(reverse("post-detail-api", args=[post.id]))
-
-        assert response.status_code == status.HTTP_200_OK
-        assert "url" in response.data
-        # Should NOT have links section
-        assert "links" not in response.data
-
-    def test_view_has_likes_hyperlink(self, api_client, post):
-        """Post detail has likes hyperlink field."""
-        response = api_client.get(reverse("post-detail-api", args=[post.id]))
-
-        assert response.status_code == status.HTTP_200_OK
-        assert "likes" in response.data
-        assert f"?post={post.id}" in response.data["likes"]
-
     def test_view_nonexistent_post(self, api_client):
         """Non-existent post returns 404."""
-        response = api_client.get(reverse("post-detail-api", args=[99999]))
+        response = api_client.get(DETAIL_URL.format(99999))
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.django_db
 class TestPostUpdate:
     """Tests for post update endpoint (PUT/PATCH /api/v1/posts/{id}/)."""
 
     def test_update_owner_only(self, other_user_api_client, post):
         """Non-owner gets 403."""
         response = other_user_api_client.put(
-            reverse("post-detail-api", args=[post.id]),
+            DETAIL_URL.format(post.id),
             {"title": "Updated", "content": "Updated content"},
         )
 
@@ -450,7 +427,7 @@ class TestPostUpdate:
     def test_update_unauthorized(self, api_client, post):
         """Anonymous gets 401."""
         response = api_client.put(
-            reverse("post-detail-api", args=[post.id]),
+            DETAIL_URL.format(post.id),
             {"title": "Updated", "content": "Updated content"},
         )
 
@@ -459,7 +436,7 @@ class TestPostUpdate:
     def test_update_by_owner_put(self, authenticated_api_client, post):
         """Owner can update their post via PUT."""
         response = authenticated_api_client.put(
-            reverse("post-detail-api", args=[post.id]),
+            DETAIL_URL.format(post.id),
             {"title": "Updated Title", "content": "Updated content"},
         )
 
@@ -472,7 +449,7 @@ class TestPostUpdate:
         """Owner can partially update their post via PATCH."""
         original_content = post.content
         response = authenticated_api_client.patch(
-            reverse("post-detail-api", args=[post.id]),
+            DETAIL_URL.format(post.id),
             {"title": "Patched Title"},
         )
 
@@ -484,7 +461,7 @@ class TestPostUpdate:
     def test_update_by_admin(self, admin_api_client, post):
         """Admin can update any post."""
         response = admin_api_client.patch(
-            reverse("post-detail-api", args=[post.id]),
+            DETAIL_URL.format(post.id),
             {"title": "Admin Updated"},
         )
 
@@ -492,64 +469,159 @@ class TestPostUpdate:
         post.refresh_from_db()
         assert post.title == "Admin Updated"
 
-    def test_update_profanity_rejected(self, authenticated_api_client, post):
-        """Update with profanity returns 400."""
-        response = authenticated_api_client.patch(
-            reverse("post-detail-api", args=[post.id]),
-            {"title": "fuck this"},
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
 
+@pytest.mark.django_db
 class TestPostDelete:
     """Tests for post deletion endpoint (DELETE /api/v1/posts/{id}/)."""
 
-    def test_delete_owner_can_delete(self, authenticated_api_client, post):
-        """Owner can delete their post."""
-        post_id = post.id
-        response = authenticated_api_client.delete(
-            reverse("post-detail-api", args=[post_id])
-        )
+    @pytest.mark.parametrize(
+        ("client_fixture_name", "expected_status", "exists_after"),
+        [
+            # Owner can delete their post
+            ("authenticated_api_client", status.HTTP_204_NO_CONTENT, False),
+            # Admin can delete any post
+            ("admin_api_client", status.HTTP_204_NO_CONTENT, False),
+            # Non-owner gets 403
+            ("other_user_api_client", status.HTTP_403_FORBIDDEN, True),
+            # Anonymous gets 401
+            ("api_client", status.HTTP_401_UNAUTHORIZED, True),
+        ],
+    )
+    def test_delete_permissions(
+        self, request, post, client_fixture_name, expected_status, exists_after
+    ):
+        """Only the owner or an admin can delete a post."""
+        client = request.getfixturevalue(client_fixture_name)
+        response = client.delete(DETAIL_URL.format(post.id))
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert not Post.objects.filter(id=post_id).exists()
+        assert response.status_code == expected_status
+        assert Post.objects.filter(pk=post.id).exists() is exists_after
 
-    def test_delete_admin_can_delete(self, admin_api_client, post):
-        """Admin can delete any post."""
+    def test_delete_cascades_likes(
+        self,
+        authenticated_api_client,
+        post,
+        user_factory,
+        django_assert_max_num_queries,
+    ):
+        """Deleting post cascades to its likes in a single DELETE."""
+        Like.objects.bulk_create(
+            Like(post=post, user=liker) for liker in user_factory.create_batch(10)
+        )
         post_id = post.id
-        response = admin_api_client.delete(reverse("post-detail-api", args=[post_id]))
+
+        # JWT user lookup, throttled last_activity_at UPDATE, post SELECT,
+        # then one DELETE for all likes and one for the post. Likes have no
+        # delete signals, so the collector never loads them one by one.
+        with django_assert_max_num_queries(5):
+            response = authenticated_api_client.delete(DETAIL_URL.format(post_id))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert not Post.objects.filter(id=post_id).exists()
+        assert not Post.objects.filter(pk=post_id).exists()
+        assert not Like.objects.filter(post_id=post_id).exists()
 
-    def test_delete_non_owner_forbidden(self, other_user_api_client, post):
-        """Non-owner gets 403."""
-        response = other_user_api_client.delete(
-            reverse("post-detail-api", args=[post.id])
-        )
 
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-        assert Post.objects.filter(id=post.id).exists()
+class TestPostAnonymousRejected:
+    """
+    Tests for anonymous requests rejected before any database access.
+
+    Update and delete are not here: their permission is object-level, so the
+    post is looked up before the 401 is returned.
+    """
 
-    def test_delete_unauthorized(self, api_client, post):
+    def test_create_requires_auth(self, api_client):
         """Anonymous gets 401."""
-        response = api_client.delete(reverse("post-detail-api", args=[post.id]))
+        response = api_client.post(
+            LIST_URL,
+            {"title": "Test", "content": "Test content"},
+        )
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        assert Post.objects.filter(id=post.id).exists()
 
-    def test_delete_cascades_likes(self, authenticated_api_client, post, like):
-        """Deleting post cascades to its likes."""
-        from apps.diary.models import Like
 
-        post_id = post.id
-        like_id = like.id
+class TestPostProfanityValidation:
+    """
+    Tests for profanity validation on post serializers.
 
-        response = authenticated_api_client.delete(
-            reverse("post-detail-api", args=[post_id])
+    The validator runs during serializer validation, so these tests call the
+    serializers directly and need neither a request nor the database.
+    """
+
+    def test_create_profanity_rejected(self):
+        """Title with profanity is rejected."""
+        serializer = PostCreateSerializer(
+            data={"title": "fuck this", "content": "Some content"}
         )
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert not Post.objects.filter(id=post_id).exists()
-        assert not Like.objects.filter(id=like_id).exists()
+        assert not serializer.is_valid()
+        assert "title" in serializer.errors
+
+    def test_create_profanity_in_content_rejected(self):
+        """Content with profanity is rejected."""
+        serializer = PostCreateSerializer(
+            data={"title": "Valid Title", "content": "This is bullshit content"}
+        )
+
+        assert not serializer.is_valid()
+        assert "content" in serializer.errors
+
+    def test_update_profanity_rejected(self):
+        """Partial update with profanity is rejected."""
+        post = Post(title="Valid Title", content="Some content")
+        serializer = PostDetailSerializer(
+            post, data={"title": "fuck this"}, partial=True
+        )
+
+        assert not serializer.is_valid()
+        assert "title" in serializer.errors
+
+    def test_profanity_error_lists_each_word_once(self):
+        """All matched words are reported once, sorted, whatever their case."""
+        serializer = PostCreateSerializer(
+            data={"title": "Valid Title", "content": "Shit, FUCK and shit again"}
+        )
+
+        assert not serializer.is_valid()
+        assert "(fuck, shit)" in str(serializer.errors["content"][0])
+
+    @pytest.mark.parametrize(
+        ("content", "word"),
+        [
+            ("ass-hat", "ass-hat"),
+            ("What an (ass-hat), honestly.", "ass-hat"),
+            ("b!tch", "b!tch"),
+            ("What a b!tch!", "b!tch"),
+        ],
+    )
+    def test_profanity_with_punctuation_in_word_rejected(self, content, word):
+        """Listed words containing punctuation match, bare or punctuated."""
+        with pytest.raises(ValidationError) as exc_info:
+            validators.profanity(content)
+
+        assert exc_info.value.params["words"] == word
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "A perfectly pleasant post.",
+            # Same letters as listed words once punctuation is removed, so
+            # they pass the quick check but are not listed words themselves
+            "as-shat",
+            "b.tch",
+        ],
+    )
+    def test_clean_content_accepted(self, content):
+        """Clean content passes, including near misses of punctuated words."""
+        validators.profanity(content)
+
+    def test_word_list_loaded_once(self, monkeypatch):
+        """Validation checks the word set loaded at import, never the file."""
+        reads = []
+        monkeypatch.setattr(
+            Path, "read_text", lambda *args, **kwargs: reads.append(args)
+        )
+
+        with pytest.raises(ValidationError):
+            validators.profanity("fuck this")
+
+        assert reads == []
@@ -10,9 +10,8 @@ Tests cover:
 """
 
 from datetime import timedelta
-from unittest.mock import Mock
 
-from django.utils import timezone
+from django.test import RequestFactory
 
 import pytest
 
@@ -26,6 +25,15 @@ from apps.diary.serializers import (
 
 pytestmark = pytest.mark.django_db
 
+_RF = RequestFactory()
+
+
+def _req(user):
+    """Build a real request authenticated as ``user`` for serializer context."""
+    request = _RF.post("/")
+    request.user = user
+    return request
+
 
 class TestUserSerializer:
     """Tests for UserSerializer (registration)."""
@@ -55,13 +63,24 @@ class TestUserSerializer:
         assert "password2" in serializer.errors
         assert "match" in str(serializer.errors["password2"]).lower()
 
-    def test_weak_password_raises_error(self):
-        """Weak password fails Django password validation."""
+    @pytest.mark.parametrize(
+        ("username", "password"),
+        [
+            # Too short
+            ("newuser", "123"),
+            # Common password
+            ("newuser", "password123"),
+            # Too similar to the username
+            ("testuser", "testuser123"),
+        ],
+    )
+    def test_invalid_password_raises_error(self, username, password):
+        """Weak, common or username-like passwords fail Django validation."""
         data = {
-            "username": "newuser",
-            "email": "newuser@example.com",
-            "password": "123",
-            "password2": "123",
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": password,
+            "password2": password,
         }
         serializer = UserSerializer(data=data)
 
@@ -70,30 +89,6 @@ class TestUserSerializer:
             "password" in serializer.errors or "non_field_errors" in serializer.errors
         )
 
-    def test_common_password_raises_error(self):
-        """Common password fails Django password validation."""
-        data = {
-            "username": "newuser",
-            "email": "newuser@example.com",
-            "password": "password123",
-            "password2": "password123",
-        }
-        serializer = UserSerializer(data=data)
-
-        assert not serializer.is_valid()
-
-    def test_password_similar_to_username_raises_error(self):
-        """Password similar to username fails validation."""
-        data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testuser123",
-            "password2": "testuser123",
-        }
-        serializer = UserSerializer(data=data)
-
-        assert not serializer.is_valid()
-
     def test_creates_user_with_hashed_password(self):
         """Created user has properly hashed password."""
         data = {
@@ -118,8 +113,7 @@ class TestPasswordChangeSerializer:
 
     def test_valid_password_change(self, user, user_password):
         """Valid password change data passes validation."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "old_password": user_password,
             "new_password": "NewSecurePass123!",
@@ -131,8 +125,7 @@ class TestPasswordChangeSerializer:
 
     def test_wrong_old_password_raises_error(self, user):
         """Wrong old password raises validation error."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "old_password": "wrongpassword",
             "new_password": "NewSecurePass123!",
@@ -145,8 +138,7 @@ class TestPasswordChangeSerializer:
 
     def test_new_passwords_mismatch_raises_error(self, user, user_password):
         """Mismatched new passwords raise validation error."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "old_password": user_password,
             "new_password": "NewSecurePass123!",
@@ -159,8 +151,7 @@ class TestPasswordChangeSerializer:
 
     def test_weak_new_password_raises_error(self, user, user_password):
         """Weak new password fails Django validation."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "old_password": user_password,
             "new_password": "123",
@@ -176,8 +167,7 @@ class TestUsernameChangeSerializer:
 
     def test_valid_username_change(self, user, user_password):
         """Valid username change data passes validation."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_username": "brandnewname",
@@ -188,8 +178,7 @@ class TestUsernameChangeSerializer:
 
     def test_wrong_password_raises_error(self, user):
         """Wrong password raises validation error."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": "wrongpassword",
             "new_username": "newname",
@@ -201,8 +190,7 @@ class TestUsernameChangeSerializer:
 
     def test_duplicate_username_raises_error(self, user, other_user, user_password):
         """Username already taken raises validation error."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_username": other_user.username,
@@ -214,8 +202,7 @@ class TestUsernameChangeSerializer:
 
     def test_duplicate_username_case_insensitive(self, user, other_user, user_password):
         """Username check is case-insensitive."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_username": other_user.username.upper(),
@@ -225,13 +212,12 @@ class TestUsernameChangeSerializer:
         assert not serializer.is_valid()
         assert "new_username" in serializer.errors
 
-    def test_cooldown_period_enforced(self, user, user_password):
+    def test_cooldown_period_enforced(self, user, user_password, frozen_now):
         """Cannot change username within 30-day cooldown."""
-        user.username_last_changed = timezone.now() - timedelta(days=10)
-        user.save()
+        user.username_last_changed = frozen_now - timedelta(days=10)
+        user.save(update_fields=["username_last_changed"])
 
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_username": "newname",
@@ -242,13 +228,12 @@ class TestUsernameChangeSerializer:
         assert "new_username" in serializer.errors
         assert "30 days" in str(serializer.errors["new_username"])
 
-    def test_cooldown_expired_allows_change(self, user, user_password):
+    def test_cooldown_expired_allows_change(self, user, user_password, frozen_now):
         """Can change username after 30-day cooldown expires."""
-        user.username_last_changed = timezone.now() - timedelta(days=31)
-        user.save()
+        user.username_last_changed = frozen_now - timedelta(days=31)
+        user.save(update_fields=["username_last_changed"])
 
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_username": "newname",
@@ -261,8 +246,7 @@ class TestUsernameChangeSerializer:
         """First username change allowed (no previous change)."""
         assert user.username_last_changed is None
 
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_username": "newname",
@@ -277,8 +261,7 @@ class TestEmailChangeSerializer:
 
     def test_valid_email_change(self, user, user_password):
         """Valid email change data passes validation."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_email": "newemail@example.com",
@@ -289,8 +272,7 @@ class TestEmailChangeSerializer:
 
     def test_wrong_password_raises_error(self, user):
         """Wrong password raises validation error."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": "wrongpassword",
             "new_email": "newemail@example.com",
@@ -302,8 +284,7 @@ class TestEmailChangeSerializer:
 
     def test_same_email_raises_error(self, user, user_password):
         """Same email as current raises validation error."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_email": user.email,
@@ -316,8 +297,7 @@ class TestEmailChangeSerializer:
 
     def test_duplicate_email_raises_error(self, user, other_user, user_password):
         """Email already taken raises validation error."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_email": other_user.email,
@@ -329,8 +309,7 @@ class TestEmailChangeSerializer:
 
     def test_duplicate_email_case_insensitive(self, user, other_user, user_password):
         """Email check is case-insensitive."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_email": other_user.email.upper(),
@@ -342,8 +321,7 @@ class TestEmailChangeSerializer:
 
     def test_email_normalized_to_lowercase(self, user, user_password):
         """Email is normalized to lowercase."""
-        request = Mock()
-        request.user = user
+        request = _req(user)
         data = {
             "password": user_password,
             "new_email": "NewEmail@EXAMPLE.COM",
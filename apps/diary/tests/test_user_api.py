@@ -12,36 +12,40 @@ import pytest
 from rest_framework import status
 from rest_framework.reverse import reverse
 
-from apps.diary.models import CustomUser
+from apps.diary.models import CustomUser, Like, Post
 
-pytestmark = pytest.mark.django_db
+LIST_URL = reverse("user-list-create-api")
+DETAIL_URL = reverse("user-detail-update-destroy-api", args=[0]).replace("/0/", "/{}/")
+CURRENT_USER_URL = reverse("current-user-api")
 
+# Valid registration payload; tests derive invalid variants from it.
+REGISTRATION = {
+    "username": "newuser",
+    "email": "newuser@example.com",
+    "password": "securepass123",
+    "password2": "securepass123",
+}
 
+
+@pytest.mark.django_db
 class TestUserRegistration:
     """Tests for user registration endpoint (POST /api/v1/users/)."""
 
     def test_register_success(self, api_client):
         """Valid data creates user and returns 201."""
-        response = api_client.post(
-            reverse("user-list-create-api"),
-            {
-                "username": "newuser",
-                "email": "newuser@example.com",
-                "password": "securepass123",
-                "password2": "securepass123",
-            },
-        )
+        response = api_client.post(LIST_URL, REGISTRATION)
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert CustomUser.objects.filter(username="newuser").exists()
-        user = CustomUser.objects.get(username="newuser")
-        assert user.email == "newuser@example.com"
-        assert user.check_password("securepass123")
+        assert response.data["username"] == REGISTRATION["username"]
+        # Anonymous callers do not get the email back, so check it on the row
+        user = CustomUser.objects.only("email", "password").get(pk=response.data["id"])
+        assert user.email == REGISTRATION["email"]
+        assert user.check_password(REGISTRATION["password"])
 
     def test_register_duplicate_email(self, api_client, user):
         """Duplicate email returns 400."""
         response = api_client.post(
-            reverse("user-list-create-api"),
+            LIST_URL,
             {
                 "username": "newuser2",
                 "email": user.email,  # existing email
@@ -56,7 +60,7 @@ class TestUserRegistration:
     def test_register_duplicate_username(self, api_client, user):
         """Duplicate username returns 400."""
         response = api_client.post(
-            reverse("user-list-create-api"),
+            LIST_URL,
             {
                 "username": user.username,  # existing username
                 "email": "different@example.com",
@@ -68,96 +72,41 @@ class TestUserRegistration:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "username" in response.data
 
-    def test_register_password_mismatch(self, api_client):
-        """Password mismatch returns 400."""
-        response = api_client.post(
-            reverse("user-list-create-api"),
-            {
-                "username": "newuser",
-                "email": "newuser@example.com",
-                "password": "securepass123",
-                "password2": "differentpass123",
-            },
-        )
+    @pytest.mark.parametrize(
+        ("payload", "error_key"),
+        [
+            # Password mismatch
+            ({**REGISTRATION, "password2": "differentpass123"}, "password2"),
+            # Too simple for Django password validation
+            (
+                {**REGISTRATION, "password": "123", "password2": "123"},
+                "non_field_errors",
+            ),
+            # Too similar to the username
+            (
+                {**REGISTRATION, "password": "newuser123", "password2": "newuser123"},
+                "non_field_errors",
+            ),
+            # Missing email
+            ({k: v for k, v in REGISTRATION.items() if k != "email"}, "email"),
+            # Missing password2
+            ({k: v for k, v in REGISTRATION.items() if k != "password2"}, "password2"),
+            # Invalid email format
+            ({**REGISTRATION, "email": "invalid-email"}, "email"),
+        ],
+    )
+    def test_register_invalid_payload(self, api_client, payload, error_key):
+        """Invalid registration data returns 400 and creates no user."""
+        response = api_client.post(LIST_URL, payload)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert not CustomUser.objects.filter(username="newuser").exists()
-
-    def test_register_password_too_simple(self, api_client):
-        """Simple password returns 400 (Django password validation)."""
-        response = api_client.post(
-            reverse("user-list-create-api"),
-            {
-                "username": "newuser",
-                "email": "newuser@example.com",
-                "password": "123",
-                "password2": "123",
-            },
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert not CustomUser.objects.filter(username="newuser").exists()
-
-    def test_register_password_similar_to_username(self, api_client):
-        """Password similar to username returns 400."""
-        response = api_client.post(
-            reverse("user-list-create-api"),
-            {
-                "username": "testuser",
-                "email": "test@example.com",
-                "password": "testuser123",
-                "password2": "testuser123",
-            },
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert not CustomUser.objects.filter(username="testuser").exists()
-
-    def test_register_missing_required_fields(self, api_client):
-        """Missing email or password2 returns 400."""
-        # Missing email
-        response = api_client.post(
-            reverse("user-list-create-api"),
-            {
-                "username": "newuser",
-                "password": "securepass123",
-                "password2": "securepass123",
-            },
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "email" in response.data
-
-        # Missing password2
-        response = api_client.post(
-            reverse("user-list-create-api"),
-            {
-                "username": "newuser",
-                "email": "newuser@example.com",
-                "password": "securepass123",
-            },
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "password2" in response.data
-
-    def test_register_invalid_email_format(self, api_client):
-        """Invalid email format returns 400."""
-        response = api_client.post(
-            reverse("user-list-create-api"),
-            {
-                "username": "newuser",
-                "email": "invalid-email",
-                "password": "securepass123",
-                "password2": "securepass123",
-            },
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "email" in response.data
+        assert error_key in response.data
+        assert not CustomUser.objects.filter(username=payload["username"]).exists()
 
     def test_register_authenticated_forbidden(self, authenticated_api_client):
         """Authenticated users cannot register (must be anonymous)."""
         response = authenticated_api_client.post(
-            reverse("user-list-create-api"),
+            LIST_URL,
             {
                 "username": "newuser",
                 "email": "newuser@example.com",
@@ -169,42 +118,49 @@ class TestUserRegistration:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+@pytest.mark.django_db
 class TestUserList:
     """Tests for user list endpoint (GET /api/v1/users/)."""
 
     def test_list_users_admin_only(self, admin_api_client, user):
         """Admin user gets 200 with list of users."""
-        response = admin_api_client.get(reverse("user-list-create-api"))
+        response = admin_api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
         assert "results" in response.data
 
     def test_list_users_regular_user_forbidden(self, authenticated_api_client):
         """Regular user gets 403."""
-        response = authenticated_api_client.get(reverse("user-list-create-api"))
+        response = authenticated_api_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_list_users_anonymous_unauthorized(self, api_client):
-        """Anonymous user gets 401."""
-        response = api_client.get(reverse("user-list-create-api"))
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
 
+@pytest.mark.django_db
 class TestUserDetail:
     """Tests for user detail endpoint (GET /api/v1/users/{id}/)."""
 
-    def test_view_own_profile(self, authenticated_api_client, user):
-        """Owner can view their profile with all sensitive fields."""
-        response = authenticated_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+    @pytest.mark.parametrize(
+        ("client_fixture_name", "profile_fixture_name"),
+        [
+            # Owner viewing their own profile
+            ("authenticated_api_client", "user"),
+            # Admin viewing any user's profile
+            ("admin_api_client", "other_user"),
+        ],
+    )
+    def test_view_profile_shows_sensitive_fields(
+        self, request, client_fixture_name, profile_fixture_name
+    ):
+        """Owner and admin see the profile with all sensitive fields."""
+        client = request.getfixturevalue(client_fixture_name)
+        profile = request.getfixturevalue(profile_fixture_name)
+
+        response = client.get(DETAIL_URL.format(profile.id))
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["username"] == user.username
-        # Owner should see all sensitive fields
-        assert response.data["email"] == user.email
+        assert response.data["username"] == profile.username
+        assert response.data["email"] == profile.email
         assert "last_activity_at" in response.data
         assert "last_login" in response.data
         assert "is_staff" in response.data
@@ -213,26 +169,14 @@ class TestUserDetail:
         assert "stats" in response.data
         assert "links" in response.data
 
-    def test_view_other_profile_allowed(
-        self, authenticated_api_client, user, other_user
-    ):
-        """Authenticated user can view other profiles."""
-        response = authenticated_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[other_user.id])
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["username"] == other_user.username
-
     def test_view_other_profile_hides_sensitive_fields(
-        self, authenticated_api_client, user, other_user
+        self, authenticated_api_client, other_user
     ):
-        """Non-owner cannot see sensitive fields on other user's profile."""
-        response = authenticated_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[other_user.id])
-        )
+        """Authenticated user can view other profiles without sensitive fields."""
+        response = authenticated_api_client.get(DETAIL_URL.format(other_user.id))
 
         assert response.status_code == status.HTTP_200_OK
+        assert response.data["username"] == other_user.username
         # These fields should be hidden from non-owners
         for field in (
             "email",
@@ -243,50 +187,15 @@ class TestUserDetail:
         ):
             assert field not in response.data
         # These fields should still be visible
-        assert "username" in response.data
         assert "date_joined" in response.data
         assert "stats" in response.data
         assert "links" in response.data
 
-    def test_admin_can_view_any_profile(self, admin_api_client, user):
-        """Admin can view any user's profile."""
-        response = admin_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-
-    def test_admin_can_see_sensitive_fields_on_any_profile(
-        self, admin_api_client, user
-    ):
-        """Admin can see all sensitive fields on any user's profile."""
-        response = admin_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        # Admin should see all sensitive fields
-        assert response.data["email"] == user.email
-        assert "last_activity_at" in response.data
-        assert "last_login" in response.data
-        assert "is_staff" in response.data
-        assert "is_active" in response.data
-
-    def test_view_profile_anonymous_unauthorized(self, api_client, user):
-        """Anonymous user gets 401."""
-        response = api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_view_profile_includes_stats_and_links(
         self, authenticated_api_client, user, post, like
     ):
         """Profile includes stats (counts) and links to related resources."""
-        response = authenticated_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+        response = authenticated_api_client.get(DETAIL_URL.format(user.id))
 
         assert response.status_code == status.HTTP_200_OK
         # Check stats (like is on user's own post, so likes_received = 1)
@@ -302,9 +211,7 @@ class TestUserDetail:
         self, authenticated_api_client, user, unpublished_post
     ):
         """Profile owner's posts_count includes their unpublished posts."""
-        response = authenticated_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+        response = authenticated_api_client.get(DETAIL_URL.format(user.id))
 
         assert response.status_code == status.HTTP_200_OK
         # Owner should see unpublished post in their count
@@ -314,9 +221,7 @@ class TestUserDetail:
         self, admin_api_client, user, unpublished_post
     ):
         """Admin sees unpublished posts in posts_count on any user's profile."""
-        response = admin_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+        response = admin_api_client.get(DETAIL_URL.format(user.id))
 
         assert response.status_code == status.HTTP_200_OK
         # Admin should see unpublished post in the count
@@ -326,9 +231,7 @@ class TestUserDetail:
         self, other_user_api_client, user, unpublished_post
     ):
         """Non-owner's view of posts_count excludes unpublished posts."""
-        response = other_user_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+        response = other_user_api_client.get(DETAIL_URL.format(user.id))
 
         assert response.status_code == status.HTTP_200_OK
         # Non-owner should NOT see unpublished post in the count
@@ -338,14 +241,10 @@ class TestUserDetail:
         self, authenticated_api_client, user, unpublished_post, other_user
     ):
         """Owner sees likes_received including likes on their unpublished posts."""
-        from apps.diary.models import Like
-
         # other_user likes the unpublished post
         Like.objects.create(user=other_user, post=unpublished_post)
 
-        response = authenticated_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+        response = authenticated_api_client.get(DETAIL_URL.format(user.id))
 
         assert response.status_code == status.HTTP_200_OK
         # Owner should see the like on their unpublished post
@@ -355,26 +254,23 @@ class TestUserDetail:
         self, other_user_api_client, user, unpublished_post, other_user
     ):
         """Non-owner's likes_received excludes likes on unpublished posts."""
-        from apps.diary.models import Like
-
         # other_user likes the unpublished post
         Like.objects.create(user=other_user, post=unpublished_post)
 
-        response = other_user_api_client.get(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+        response = other_user_api_client.get(DETAIL_URL.format(user.id))
 
         assert response.status_code == status.HTTP_200_OK
         # Non-owner should NOT see likes on unpublished posts
         assert response.data["stats"]["likes_received"] == 0
 
 
+@pytest.mark.django_db
 class TestCurrentUser:
     """Tests for current user endpoint (GET /api/v1/users/me/)."""
 
     def test_get_current_user(self, authenticated_api_client, user):
         """Authenticated user can get their own profile via /me endpoint."""
-        response = authenticated_api_client.get(reverse("current-user-api"))
+        response = authenticated_api_client.get(CURRENT_USER_URL)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == user.id
@@ -385,44 +281,30 @@ class TestCurrentUser:
         assert "stats" in response.data
         assert "links" in response.data
 
-    def test_get_current_user_anonymous_unauthorized(self, api_client):
-        """Anonymous user gets 401."""
-        response = api_client.get(reverse("current-user-api"))
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
 
+@pytest.mark.django_db
 class TestUserUpdate:
     """Tests for user update (PUT/PATCH not allowed - use dedicated endpoints)."""
 
-    def test_update_via_put_not_allowed(self, authenticated_api_client, user):
-        """PUT method returns 405 (use dedicated endpoints)."""
-        response = authenticated_api_client.put(
-            reverse("user-detail-update-destroy-api", args=[user.id]),
-            {"email": "newemail@example.com"},
-        )
-
-        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
-
-    def test_update_via_patch_not_allowed(self, authenticated_api_client, user):
-        """PATCH method returns 405 (use dedicated endpoints)."""
-        response = authenticated_api_client.patch(
-            reverse("user-detail-update-destroy-api", args=[user.id]),
+    @pytest.mark.parametrize("method", ["put", "patch"])
+    def test_update_not_allowed(self, authenticated_api_client, user, method):
+        """PUT and PATCH return 405 (use dedicated endpoints)."""
+        response = getattr(authenticated_api_client, method)(
+            DETAIL_URL.format(user.id),
             {"email": "newemail@example.com"},
         )
 
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
 
+@pytest.mark.django_db
 class TestUserDelete:
     """Tests for user deletion endpoint (DELETE /api/v1/users/{id}/)."""
 
     def test_delete_own_account(self, authenticated_api_client, user):
         """Owner can delete their account."""
         user_id = user.id
-        response = authenticated_api_client.delete(
-            reverse("user-detail-update-destroy-api", args=[user_id])
-        )
+        response = authenticated_api_client.delete(DETAIL_URL.format(user_id))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not CustomUser.objects.filter(id=user_id).exists()
@@ -431,9 +313,7 @@ class TestUserDelete:
         self, authenticated_api_client, user, other_user
     ):
         """Non-owner cannot delete another user's account."""
-        response = authenticated_api_client.delete(
-            reverse("user-detail-update-destroy-api", args=[other_user.id])
-        )
+        response = authenticated_api_client.delete(DETAIL_URL.format(other_user.id))
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert CustomUser.objects.filter(id=other_user.id).exists()
@@ -441,18 +321,14 @@ class TestUserDelete:
     def test_admin_can_delete_any_account(self, admin_api_client, user):
         """Admin can delete any user's account."""
         user_id = user.id
-        response = admin_api_client.delete(
-            reverse("user-detail-update-destroy-api", args=[user_id])
-        )
+        response = admin_api_client.delete(DETAIL_URL.format(user_id))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not CustomUser.objects.filter(id=user_id).exists()
 
     def test_delete_anonymous_unauthorized(self, api_client, user):
         """Anonymous user gets 401."""
-        response = api_client.delete(
-            reverse("user-detail-update-destroy-api", args=[user.id])
-        )
+        response = api_client.delete(DETAIL_URL.format(user.id))
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert CustomUser.objects.filter(id=user.id).exists()
@@ -461,17 +337,38 @@ class TestUserDelete:
         self, authenticated_api_client, user, post, like
     ):
         """Deleting user cascades to their posts and likes."""
-        from apps.diary.models import Like, Post
-
         user_id = user.id
         post_id = post.id
         like_id = like.id
 
-        response = authenticated_api_client.delete(
-            reverse("user-detail-update-destroy-api", args=[user_id])
-        )
+        response = authenticated_api_client.delete(DETAIL_URL.format(user_id))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not CustomUser.objects.filter(id=user_id).exists()
         assert not Post.objects.filter(id=post_id).exists()
         assert not Like.objects.filter(id=like_id).exists()
+
+
+class TestUserAnonymousRejected:
+    """
+    Tests for anonymous requests rejected before any database access.
+
+    The permission check fails before the user is looked up, so the detail URL
+    does not need an existing user. Anonymous delete stays in TestUserDelete
+    because it asserts that the user still exists; the PUT/PATCH 405 checks
+    stay in TestUserUpdate because they need an authenticated user.
+    """
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param(LIST_URL, id="user-list"),
+            pytest.param(DETAIL_URL.format(1), id="user-detail"),
+            pytest.param(CURRENT_USER_URL, id="current-user"),
+        ],
+    )
+    def test_get_anonymous_unauthorized(self, api_client, url):
+        """Anonymous user gets 401."""
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
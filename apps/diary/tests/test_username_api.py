@@ -10,14 +10,14 @@ Tests cover:
 
 from datetime import timedelta
 
-from django.utils import timezone
-
 import pytest
 from rest_framework import status
 from rest_framework.reverse import reverse
 
 pytestmark = pytest.mark.django_db
 
+USERNAME_CHANGE_URL = reverse("username-change-api")
+
 
 class TestUsernameChange:
     """Tests for username change endpoint (POST /api/v1/auth/username/change/)."""
@@ -25,7 +25,7 @@ class TestUsernameChange:
     def test_change_success(self, authenticated_api_client, user, user_password):
         """Valid password and unique username succeeds."""
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "NewUsername",
@@ -37,13 +37,13 @@ class TestUsernameChange:
         assert response.data["username"] == "NewUsername"
 
         # Verify username was changed
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["username"])
         assert user.username == "NewUsername"
 
     def test_change_requires_auth(self, api_client):
         """Anonymous gets 401."""
         response = api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": "anypassword",
                 "new_username": "NewUsername",
@@ -57,7 +57,7 @@ class TestUsernameChange:
         old_username = user.username
 
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": "wrongpassword",
                 "new_username": "NewUsername",
@@ -68,7 +68,7 @@ class TestUsernameChange:
         assert "password" in response.data
 
         # Username should remain unchanged
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["username"])
         assert user.username == old_username
 
     def test_change_duplicate_rejected(
@@ -76,7 +76,7 @@ class TestUsernameChange:
     ):
         """Duplicate username returns 400."""
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": other_user.username,
@@ -91,7 +91,7 @@ class TestUsernameChange:
     ):
         """Duplicate username check is case-insensitive."""
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": other_user.username.upper(),  # same, different case
@@ -106,7 +106,7 @@ class TestUsernameChange:
         assert user.username_last_changed is None
 
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "NewUsername",
@@ -115,7 +115,7 @@ class TestUsernameChange:
 
         assert response.status_code == status.HTTP_200_OK
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["username_last_changed"])
         assert user.username_last_changed is not None
 
     def test_change_cooldown_enforced(
@@ -124,7 +124,7 @@ class TestUsernameChange:
         """30-day cooldown prevents immediate second change."""
         # First change
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "FirstChange",
@@ -134,7 +134,7 @@ class TestUsernameChange:
 
         # Immediate second change should fail
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "SecondChange",
@@ -146,19 +146,19 @@ class TestUsernameChange:
         assert "30 days" in str(response.data["new_username"])
 
         # Username should remain at first change
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["username"])
         assert user.username == "FirstChange"
 
     def test_change_after_cooldown_expires(
-        self, authenticated_api_client, user, user_password
+        self, authenticated_api_client, user, user_password, frozen_now
     ):
         """Change succeeds after 30-day cooldown."""
         # Set username_last_changed to 31 days ago
-        user.username_last_changed = timezone.now() - timedelta(days=31)
-        user.save()
+        user.username_last_changed = frozen_now - timedelta(days=31)
+        user.save(update_fields=["username_last_changed"])
 
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "AfterCooldown",
@@ -167,21 +167,21 @@ class TestUsernameChange:
 
         assert response.status_code == status.HTTP_200_OK
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["username"])
         assert user.username == "AfterCooldown"
 
     def test_change_cooldown_at_boundary(
-        self, authenticated_api_client, user, user_password
+        self, authenticated_api_client, user, user_password, frozen_now
     ):
         """Change succeeds at exactly 30 days (cooldown has passed)."""
         # Set username_last_changed to exactly 30 days ago
         # The cooldown check is `now < cooldown_end`, so at exactly 30 days
         # the check fails (now == cooldown_end), meaning cooldown has passed
-        user.username_last_changed = timezone.now() - timedelta(days=30)
-        user.save()
+        user.username_last_changed = frozen_now - timedelta(days=30)
+        user.save(update_fields=["username_last_changed"])
 
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "AtBoundary",
@@ -192,15 +192,15 @@ class TestUsernameChange:
         assert response.status_code == status.HTTP_200_OK
 
     def test_change_cooldown_just_before_boundary(
-        self, authenticated_api_client, user, user_password
+        self, authenticated_api_client, user, user_password, frozen_now
     ):
         """Change fails just before 30 days (still within cooldown)."""
         # Set username_last_changed to 29 days ago (still within cooldown)
-        user.username_last_changed = timezone.now() - timedelta(days=29)
-        user.save()
+        user.username_last_changed = frozen_now - timedelta(days=29)
+        user.save(update_fields=["username_last_changed"])
 
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "BeforeBoundary",
@@ -213,7 +213,7 @@ class TestUsernameChange:
     def test_change_missing_password(self, authenticated_api_client, user):
         """Missing password returns 400."""
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {"new_username": "NewUsername"},
         )
 
@@ -225,7 +225,7 @@ class TestUsernameChange:
     ):
         """Missing new_username returns 400."""
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {"password": user_password},
         )
 
@@ -237,7 +237,7 @@ class TestUsernameChange:
     ):
         """Username longer than 150 chars returns 400."""
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "a" * 151,
@@ -252,7 +252,7 @@ class TestUsernameChange:
     ):
         """Username with invalid characters returns 400."""
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": "user name with spaces",
@@ -269,7 +269,7 @@ class TestUsernameChange:
         old_username = user.username
 
         response = authenticated_api_client.post(
-            reverse("username-change-api"),
+            USERNAME_CHANGE_URL,
             {
                 "password": user_password,
                 "new_username": old_username.upper(),  # Same username, different case
@@ -279,5 +279,5 @@ class TestUsernameChange:
         # This should succeed - user is changing their own username's case
         assert response.status_code == status.HTTP_200_OK
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["username"])
         assert user.username == old_username.upper()
@@ -0,0 +1,47 @@
+"""
+Django settings for the test suite.
+
+Extends the main settings with overrides that only make sense under pytest
+(selected via DJANGO_SETTINGS_MODULE in pyproject.toml).
+
+Database: in-memory SQLite by default, so test inserts never touch the
+filesystem or the network. Django's SQLite backend enables foreign key
+enforcement on every connection, so ON DELETE CASCADE behaves as on
+PostgreSQL. Set TEST_DATABASE_URL to run the suite against another
+database, e.g. the PostgreSQL service from docker-compose.
+"""
+
+from .settings import *  # noqa: F403
+from .settings import REST_FRAMEWORK, env
+
+# ==============================================================================
+# DATABASE
+# ==============================================================================
+
+DATABASES = {
+    "default": env.db("TEST_DATABASE_URL", default="sqlite://:memory:"),
+}
+
+
+# ==============================================================================
+# AUTHENTICATION
+# ==============================================================================
+
+# The default PBKDF2 hasher is deliberately slow; MD5 makes creating users and
+# checking passwords in tests practically free.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
+
+# ==============================================================================
+# DJANGO REST FRAMEWORK
+# ==============================================================================
+
+# APIClient encodes request bodies as multipart by default; JSON is what the
+# API's clients send and is cheaper to encode and parse. Pass format= to a
+# request that needs another encoding (e.g. file uploads).
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "TEST_REQUEST_DEFAULT_FORMAT": "json",
+}